@@ -1,5 +1,87 @@
+import functools
+from types import MappingProxyType
+
+import numpy as np
 import pandas as pd
 
+from utils import (
+    apply_rows,
+    apply_rows_unique,
+    check_n_jobs,
+    get_components_validator,
+    map_values,
+)
+
+# below this number of rows, finding the unique rows costs more than it saves.
+_CACHE_MIN_ROWS = 1000
+
+_NO_FORCED_COMPONENTS = MappingProxyType({})
+
+_INIT_TYPE_ERROR_MESSAGE = (
+    "needs to be initialized with either the name as string, or a dict of the "
+    "name components."
+)
+
+
+class _DictComponents(dict):
+    """
+    holds the components of one name in a dict, for component keys which can't
+    be used as __slots__.
+    """
+
+    def as_dict(self):
+        return dict(self)
+
+
+def _make_components_class(name, component_keys):
+    """
+    create a class which holds the components of one name in __slots__, one per
+    component key, which takes less memory than a dict per namer instance.
+
+    if any key is not a valid attribute name, or would collide with the
+    attributes of that class, _DictComponents is returned instead.
+    """
+    keys = tuple(component_keys)
+    if not all(
+        key.isidentifier() and not key.startswith("__") and key != "as_dict"
+        for key in keys
+    ):
+        return _DictComponents
+
+    missing = object()
+
+    def __init__(self, components):
+        for key, value in components.items():
+            setattr(self, key, value)
+
+    def as_dict(self):
+        # a name which is parsed may not have all components
+        return {
+            key: value
+            for key in keys
+            if (value := getattr(self, key, missing)) is not missing
+        }
+
+    def __repr__(self):
+        return f"{name}({self.as_dict()!r})"
+
+    return type(
+        name,
+        (object,),
+        {
+            "__slots__": keys,
+            "__init__": __init__,
+            "as_dict": as_dict,
+            "__repr__": __repr__,
+        },
+    )
+
+
+def _format_row(namer_cls, fixed_components, forced_components, row):
+    return namer_cls._name_formatter(
+        {**fixed_components, **row}, forced_components=forced_components
+    )
+
 
 class BaseNamer(object):
     """
@@ -21,16 +103,48 @@ class BaseNamer(object):
 
         - cls.component_keys: a list of the keys of the components.
 
-        - self._name_parser (as @property): the function which takes a name
+        - cls._name_parser (as staticmethod): the function which takes a name
           string and returns the extracted components dict.
 
-        - self._name_formatter (as @property): the function which takes a
-          components dict and returns the correct name string.
+        - cls._name_formatter (as staticmethod): the function which takes a
+          components dict, validates it, and returns the correct name string.
+
+    optionally, a child implementation can set:
+
+        - cls._vectorized_parser: a function which takes a pd.Series of name
+          strings and returns a pd.DataFrame with a column per component. if
+          set, it is used by parse_names_series instead of parsing row by row.
+
+        - cls._vectorized_formatter: a function which takes a pd.DataFrame of
+          components (and the default_components and forced_components
+          dicts) and returns a pd.Series of name strings. if set, it is used
+          by format_components_df instead of formatting row by row.
     """
 
-    _forced_components = {}
+    _forced_components = _NO_FORCED_COMPONENTS
+    _forced_items = ()
+    _fast_validator = None
+    _vectorized_parser = None
+    _vectorized_formatter = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # validated once when the child class is defined, instead of on every
+        # instantiation.
+        cls._validate_required_attrs_on_child_implementation()
+        cls._fast_validator = staticmethod(
+            get_components_validator(cls._schematic)
+        )
+        # the forced components are constant, so they are stored as items to
+        # merge them cheaply, and exposed as a read-only mapping.
+        cls._forced_items = tuple(cls._forced_components.items())
+        cls._forced_components = MappingProxyType(dict(cls._forced_items))
+        cls._components_class = _make_components_class(
+            f"{cls.__name__}Components", cls.component_keys
+        )
 
-    def _validate_required_attrs_on_child_implementation(self):
+    @classmethod
+    def _validate_required_attrs_on_child_implementation(cls):
         """
         validates whether the child implementation (in the code) has set the
         correct attributes.
@@ -41,7 +155,7 @@ class BaseNamer(object):
             "_name_parser",
             "_name_formatter",
         ]:
-            if not hasattr(self, attr):
+            if not hasattr(cls, attr):
                 raise NotImplementedError(
                     "the child implementation of BaseNamer you "
                     "are trying to use has not set the required attribute "
@@ -60,33 +174,88 @@ class BaseNamer(object):
             enabled if you explicitly need to circumvent this behaviour
             (default: False).
         """
-        self._validate_required_attrs_on_child_implementation()
-        self._skip_forced_components = skip_forced_components
-
         if isinstance(name_or_components, str):
-            # if it's the name, we parse it to the components
-            self._components = self._name_parser(name_or_components)
+            self._init_from_name(name_or_components, skip_forced_components)
         elif isinstance(name_or_components, dict):
-            # we only perform validation if it's the components, because this
-            # performs necessary type conversions and you should only be able
-            # to name something from valid components.
-            self._components = self._schematic.validate(
+            self._init_from_components(
+                name_or_components, skip_forced_components
+            )
+        else:
+            raise TypeError(_INIT_TYPE_ERROR_MESSAGE)
+
+    def _init_from_name(self, name, skip_forced_components):
+        self._skip_forced_components = skip_forced_components
+        # if it's the name, we parse it to the components
+        self._components = self._components_class(self._name_parser(name))
+
+    def _init_from_components(self, components, skip_forced_components):
+        self._skip_forced_components = skip_forced_components
+        # we only perform validation if it's the components, because this
+        # performs necessary type conversions and you should only be able to
+        # name something from valid components.
+        self._components = self._components_class(
+            self._fast_validator(
                 # here, forced_components are used as defaults so that
                 # validation doesn't fail. however, we don't force them because
                 # we should parse exactly what was given in init.
-                {**self.forced_components, **name_or_components}
-            )
-        else:
-            raise TypeError(
-                "needs to be initialized with either the name as "
-                "string, or a dict of the name components."
+                self._with_forced_components(
+                    components, skip_forced_components
+                )
             )
+        )
+
+    @classmethod
+    def from_name(cls, name: str, skip_forced_components=False):
+        """
+        initialize the namer class from a name string, without checking the
+        type of the arg.
+
+        see __init__ for the params.
+        """
+        namer = cls.__new__(cls)
+        namer._init_from_name(name, skip_forced_components)
+        return namer
+
+    @classmethod
+    def from_components(cls, components: dict, skip_forced_components=False):
+        """
+        initialize the namer class from a dict of components, without checking
+        the type of the arg.
+
+        see __init__ for the params.
+        """
+        namer = cls.__new__(cls)
+        namer._init_from_components(components, skip_forced_components)
+        return namer
 
     @property
     def forced_components(self):
-        if self._skip_forced_components:
-            return {}
-        return self._forced_components
+        return self._get_forced_components(self._skip_forced_components)
+
+    @classmethod
+    def _get_forced_components(cls, skip_forced_components=False):
+        if skip_forced_components:
+            return _NO_FORCED_COMPONENTS
+        return cls._forced_components
+
+    @classmethod
+    def _with_forced_components(cls, components, skip_forced_components):
+        """
+        returns a new dict of the given components, with the forced
+        components as defaults.
+        """
+        merged = dict(() if skip_forced_components else cls._forced_items)
+        merged.update(components)
+        return merged
+
+    @classmethod
+    def clear_caches(cls):
+        """
+        clear the caches of the name parser and formatter, if they are cached.
+        """
+        for func in [cls._name_parser, cls._name_formatter]:
+            if hasattr(func, "cache_clear"):
+                func.cache_clear()
 
     @classmethod
     def rename(cls, name: str, components: dict):
@@ -95,31 +264,56 @@ class BaseNamer(object):
 
         :returns: the new name, as a string.
         """
-        dname = cls(name)
+        dname = cls.from_name(name)
         dname.update(components)
         return dname.name
 
     @classmethod
-    def format(cls, *args, **kwargs):
+    def format(cls, name_or_components, skip_forced_components=False):
         """
         convenience method to immediately return the formatted name.
 
-        params are equivalent to the initialization args of this class.
+        params are equivalent to the initialization args of this class, but no
+        namer instance is created, because the formatter validates the
+        components itself.
 
         :returns: the formatted name as a string.
         """
-        return cls(*args, **kwargs).name
+        if isinstance(name_or_components, str):
+            components = cls._name_parser(name_or_components)
+        elif isinstance(name_or_components, dict):
+            # forced_components are used as defaults, like in __init__
+            components = cls._with_forced_components(
+                name_or_components, skip_forced_components
+            )
+        else:
+            raise TypeError(_INIT_TYPE_ERROR_MESSAGE)
+        return cls._name_formatter(
+            components,
+            forced_components=cls._get_forced_components(
+                skip_forced_components
+            ),
+        )
 
     @classmethod
-    def parse(cls, *args, **kwargs):
+    def parse(cls, name_or_components, skip_forced_components=False):
         """
         convenience method to immediately return the parsed components.
 
-        params are equivalent to the initialization args of this class.
+        params are equivalent to the initialization args of this class, but no
+        namer instance is created.
 
         :returns: the parsed components dict.
         """
-        return cls(*args, **kwargs).components
+        if isinstance(name_or_components, str):
+            return cls._name_parser(name_or_components)
+        elif isinstance(name_or_components, dict):
+            return cls._fast_validator(
+                cls._with_forced_components(
+                    name_or_components, skip_forced_components
+                )
+            )
+        raise TypeError(_INIT_TYPE_ERROR_MESSAGE)
 
     @classmethod
     def format_components_df(
@@ -127,7 +321,9 @@ class BaseNamer(object):
         components_df,
         default_components={},
         existing_column_prefix=None,
-        **kwargs,
+        cache=None,
+        n_jobs=1,
+        skip_forced_components=False,
     ):
         """
         given a df whose columns are the various components, returns a series
@@ -143,7 +339,18 @@ class BaseNamer(object):
         :param existing_column_prefix: if the df columns are prefixed with some
             common prefix (like when registering data from a manager), pass
             that prefix and this method will deal with it (default: None).
+        :param cache: if True, each unique row is only formatted once when
+            formatting row by row. should not be enabled for namers whose
+            formatter is not deterministic. if None, it is enabled for dfs with
+            more than 1000 rows (default: None).
+        :param n_jobs: the number of processes to use when formatting row by
+            row, or -1 to use one per cpu. only used for large dfs, and
+            requires the namer class to be picklable. ignored if the namer has
+            a cls._vectorized_formatter (default: 1).
+        :param skip_forced_components: if True, cls._forced_components are not
+            applied to the rows (default: False).
         """
+        check_n_jobs(n_jobs)
         if existing_column_prefix is not None:
             # remove that prefix
             components_df = components_df.rename(
@@ -153,11 +360,8 @@ class BaseNamer(object):
                 }
             )
 
-        forced_component_keys = (
-            []
-            if kwargs.get("skip_forced_components")
-            else list(cls._forced_components.keys())
-        )
+        forced_components = cls._get_forced_components(skip_forced_components)
+        forced_component_keys = list(forced_components.keys())
         present_keys_in_components_df = [
             key for key in cls.component_keys if key in components_df
         ]
@@ -181,30 +385,94 @@ class BaseNamer(object):
                 f"{', '.join(missing_keys)}"
             )
 
-        def _format_row(row):
-            return cls.format(
-                {**default_components, **row},
-                **kwargs,
+        if cls._vectorized_formatter is not None:
+            return cls._vectorized_formatter(
+                components_df[present_keys_in_components_df],
+                default_components=default_components,
+                forced_components=forced_components,
             )
 
-        return components_df[present_keys_in_components_df].apply(_format_row)
+        # the components which are the same for every row are merged once,
+        # instead of for every row.
+        fixed_components = cls._with_forced_components(
+            default_components, skip_forced_components
+        )
+        if not fixed_components and n_jobs == 1:
+            format_row = cls._name_formatter
+        else:
+            # a partial of a module-level function (with a plain dict, not the
+            # mappingproxy), so that it can be pickled when formatting in
+            # multiple processes.
+            format_row = functools.partial(
+                _format_row, cls, fixed_components, dict(forced_components)
+            )
+
+        components_df = components_df[present_keys_in_components_df]
+        if cache is None:
+            cache = len(components_df) > _CACHE_MIN_ROWS
+        if cache:
+            return apply_rows_unique(components_df, format_row, n_jobs=n_jobs)
+        return apply_rows(components_df, format_row, n_jobs=n_jobs)
 
     @classmethod
-    def parse_names_series(cls, names, **kwargs):
+    def parse_names_series(
+        cls, names, cache=None, raw=False, n_jobs=1, **kwargs
+    ):
         """
         parse all name strings in the given series (or list-like), and return a
         dataframe where each extracted component is a column.
 
         :param names: a pd.Series (or list-like) containing the name strings
             that should be parsed.
+        :param cache: if True, each unique name is only parsed once when
+            parsing row by row, which is a lot faster if there are many
+            duplicate names. if None, it is enabled for series with more than
+            1000 names (default: None).
+        :param raw: if True, return a 2d np.ndarray instead of a
+            pd.DataFrame, whose columns are the components in the order of
+            cls.component_keys. this is faster if the caller works on the
+            columns directly (default: False).
+        :param n_jobs: the number of processes to use when parsing row by row,
+            or -1 to use one per cpu. only used for large series, and requires
+            the namer class to be picklable. ignored if the namer has a
+            cls._vectorized_parser (default: 1).
 
         :returns: a pd.DataFrame with the same index as `names`, where each
-                  extracted component is a column.
+                  extracted component is a column (or a np.ndarray, if raw).
         """
+        check_n_jobs(n_jobs)
         if not isinstance(names, pd.Series):
             names = pd.Series(names)
 
-        components = names.apply(cls.parse, **kwargs).tolist()
+        if cls._vectorized_parser is not None:
+            # parsing a string is not gated by the schema, so there is no need
+            # to instantiate a namer per row.
+            components_df = cls._vectorized_parser(names)
+            return components_df.to_numpy() if raw else components_df
+
+        parse = functools.partial(cls.parse, **kwargs)
+        if cache is None:
+            cache = len(names) > _CACHE_MIN_ROWS
+        if cache:
+            unique_names = names.drop_duplicates().tolist()
+            parsed = pd.Series(
+                map_values(parse, unique_names, n_jobs=n_jobs),
+                index=unique_names,
+                dtype=object,
+            )
+            components = names.map(parsed).tolist()
+        else:
+            components = map_values(parse, names.tolist(), n_jobs=n_jobs)
+
+        if raw:
+            # a parsed name may not have all components
+            return np.array(
+                [
+                    [component.get(key) for key in cls.component_keys]
+                    for component in components
+                ],
+                dtype=object,
+            ).reshape(len(components), len(cls.component_keys))
         return pd.DataFrame(
             components,
             columns=cls.component_keys,
@@ -216,16 +484,23 @@ class BaseNamer(object):
         """
         the name's components.
         """
-        return self._components
+        return self._components.as_dict()
 
     @property
     def name(self):
         """
         the formatted name string.
         """
-        return self._name_formatter(
-            self._components, forced_components=self.forced_components
+        components = self._components.as_dict()
+        original_components = dict(components)
+        name = self._name_formatter(
+            components, forced_components=self.forced_components
         )
+        # the formatter may fill in components (like a random prefix), which
+        # should be kept so that the name stays the same.
+        if components != original_components:
+            self._components = self._components_class(components)
+        return name
 
     def update(self, new_components_partial: dict):
         """
@@ -233,8 +508,24 @@ class BaseNamer(object):
         """
         # not using self._components.update because we want to validate the
         # full new dict
-        new_components = {**self._components, **new_components_partial}
-        self._components = self._schematic.validate(new_components)
+        new_components = {
+            **self._components.as_dict(),
+            **new_components_partial,
+        }
+        self._components = self._components_class(
+            self._fast_validator(new_components)
+        )
+
+    def __getstate__(self):
+        # the components class is created per namer class, so it can't be
+        # pickled by reference; the components are pickled as a dict instead.
+        state = dict(self.__dict__)
+        state["_components"] = self._components.as_dict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._components = self._components_class(state["_components"])
 
     def __str__(self):
         return self.name
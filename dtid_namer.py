@@ -4,8 +4,11 @@ this is the DTIDNamer, which uses the BaseNamer implementation.
 
 from base_namer import BaseNamer
 from utils import (
+    cache_name_parser,
     get_name_parser,
     get_name_formatter,
+    get_vectorized_name_parser,
+    get_vectorized_name_formatter,
 )
 from schema import Schema, Use
 
@@ -21,10 +24,20 @@ DTID_COMPONENTS_SCHEMA = Schema(
 DTID_COMPONENTS = ["document_id", "tabletype", "tnum"]
 separator = "/"
 
-parse_workspace_name = get_name_parser(DTID_COMPONENTS, separator=separator)
+# dtids are typically seen many times in a pipeline, so the parser is
+# memoized.
+parse_workspace_name = cache_name_parser(
+    get_name_parser(DTID_COMPONENTS, separator=separator)
+)
+parse_workspace_names = get_vectorized_name_parser(
+    DTID_COMPONENTS, separator=separator
+)
 format_workspace_name = get_name_formatter(
     DTID_COMPONENTS, DTID_COMPONENTS_SCHEMA, separator=separator
 )
+format_workspace_names = get_vectorized_name_formatter(
+    DTID_COMPONENTS, DTID_COMPONENTS_SCHEMA, separator=separator
+)
 
 
 class DTIDNamer(BaseNamer):
@@ -36,11 +49,7 @@ class DTIDNamer(BaseNamer):
 
     _schematic = DTID_COMPONENTS_SCHEMA
     component_keys = DTID_COMPONENTS
-
-    @property
-    def _name_parser(self):
-        return parse_workspace_name
-
-    @property
-    def _name_formatter(self):
-        return format_workspace_name
+    _name_parser = staticmethod(parse_workspace_name)
+    _name_formatter = staticmethod(format_workspace_name)
+    _vectorized_parser = staticmethod(parse_workspace_names)
+    _vectorized_formatter = staticmethod(format_workspace_names)
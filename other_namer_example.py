@@ -10,15 +10,18 @@ it would be great if you give it a shot!  or to think on a high level about how
 it would work with the new implementation.
 """
 
+import re
+
 import pandas as pd
 from schema import Schema, Optional, Or
 
 from base_namer import BaseNamer
 from utils import (
     get_random_alphanumeric_string,
+    get_random_alphanumeric_strings,
+    validate_str_column,
 )
 
-
 SS_FILE_COMPONENTS_SCHEMA = Schema(
     {
         Optional("prefix", default=None): Or(str, None),
@@ -28,29 +31,67 @@ SS_FILE_COMPONENTS_SCHEMA = Schema(
 SS_FILE_COMPONENTS = ["prefix", "fname"]
 
 
+# only valid prefixed fname if startswith ^, followed by 3 characters, and then
+# a |.
+SS_FILE_NAME_RE = re.compile(r"\A\^(?P<prefix>.{3})\|(?P<fname>.*)", re.DOTALL)
+
+
 def parse_ss_file_name(fname):
-    # only valid prefixed fname if startswith ^, followed by 3 characters, and
-    # then a |.
-    if fname.startswith("^") and len(fname) > 4 and fname[4] == "|":
-        return dict(zip(SS_FILE_COMPONENTS, [fname[1:4], fname[5:]]))
-    else:
-        return dict(zip(SS_FILE_COMPONENTS, [None, fname]))
+    m = SS_FILE_NAME_RE.match(fname)
+    if m:
+        return {"prefix": m.group("prefix"), "fname": m.group("fname")}
+    return {"prefix": None, "fname": fname}
+
+
+def parse_ss_file_names_series(names):
+    names = names.astype(str)
+    components = names.str.extract(SS_FILE_NAME_RE, expand=True)
+    # names without a valid prefix are kept as is
+    components["fname"] = components["fname"].fillna(names)
+    return components[SS_FILE_COMPONENTS]
 
 
 def format_ss_file_name(obj, forced_components={}):
-    if "prefix" not in obj or pd.isnull(obj.get("prefix")):
-        obj["prefix"] = get_random_alphanumeric_string(3)
-    return "^{}|{}".format(obj["prefix"], obj["fname"])
+    components = SS_FILE_COMPONENTS_SCHEMA.validate(
+        {**obj, **forced_components}
+    )
+    if components["prefix"] is None:
+        # the prefix is also set on obj, so that a namer instance keeps the
+        # same name.
+        prefix = get_random_alphanumeric_string(3)
+        obj["prefix"] = components["prefix"] = prefix
+    return "^{}|{}".format(components["prefix"], components["fname"])
+
+
+def format_ss_file_names_df(
+    components_df, default_components={}, forced_components={}
+):
+    components = {**default_components, **forced_components}
+    prefix, fname = [
+        (
+            components_df[key]
+            if key in components_df and key not in forced_components
+            else pd.Series(components.get(key), index=components_df.index)
+        )
+        for key in SS_FILE_COMPONENTS
+    ]
+    validate_str_column("fname", fname)
+    prefix = prefix.astype(object)
+    missing = prefix.isnull()
+    validate_str_column("prefix", prefix[~missing])
+    if missing.any():
+        prefix[missing] = get_random_alphanumeric_strings(missing.sum(), 3)
+    return (
+        ("^" + prefix.astype(str))
+        .str.cat(fname.astype(str), sep="|")
+        .rename(None)
+    )
 
 
 class SSFileNamer(BaseNamer):
     _schematic = SS_FILE_COMPONENTS_SCHEMA
     component_keys = SS_FILE_COMPONENTS
-
-    @property
-    def _name_parser(self):
-        return parse_ss_file_name
-
-    @property
-    def _name_formatter(self):
-        return format_ss_file_name
+    _name_parser = staticmethod(parse_ss_file_name)
+    _name_formatter = staticmethod(format_ss_file_name)
+    _vectorized_parser = staticmethod(parse_ss_file_names_series)
+    _vectorized_formatter = staticmethod(format_ss_file_names_df)
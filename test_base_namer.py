@@ -0,0 +1,114 @@
+import pickle
+import unittest
+
+import pandas as pd
+from schema import Schema, Use
+
+from base_namer import BaseNamer
+from dtid_namer import DTIDNamer
+from other_namer_example import SSFileNamer
+from utils import (
+    get_name_formatter,
+    get_name_parser,
+    get_vectorized_name_formatter,
+)
+
+SLUG_COMPONENTS = ["status", "client-slug"]
+SLUG_COMPONENTS_SCHEMA = Schema({"status": str, "client-slug": str})
+
+
+class SlugNamer(BaseNamer):
+    # "client-slug" can't be a __slots__ attribute
+    _schematic = SLUG_COMPONENTS_SCHEMA
+    component_keys = SLUG_COMPONENTS
+    _name_parser = staticmethod(get_name_parser(SLUG_COMPONENTS))
+    _name_formatter = staticmethod(
+        get_name_formatter(SLUG_COMPONENTS, SLUG_COMPONENTS_SCHEMA)
+    )
+
+
+def _to_int_str(value):
+    return str(int(value))
+
+
+NUMBERED_COMPONENTS = ["a", "c", "n"]
+NUMBERED_COMPONENTS_SCHEMA = Schema(
+    {"a": str, "c": str, "n": Use(_to_int_str)}
+)
+
+
+class NumberedNamer(BaseNamer):
+    _schematic = NUMBERED_COMPONENTS_SCHEMA
+    component_keys = NUMBERED_COMPONENTS
+    _forced_components = {"n": "007"}
+    _name_parser = staticmethod(get_name_parser(NUMBERED_COMPONENTS))
+    _name_formatter = staticmethod(
+        get_name_formatter(NUMBERED_COMPONENTS, NUMBERED_COMPONENTS_SCHEMA)
+    )
+
+
+class VectorizedNumberedNamer(NumberedNamer):
+    _vectorized_formatter = staticmethod(
+        get_vectorized_name_formatter(
+            NUMBERED_COMPONENTS, NUMBERED_COMPONENTS_SCHEMA
+        )
+    )
+
+
+class TestForcedComponents(unittest.TestCase):
+    def test_forced_components_are_validated_everywhere(self):
+        components = {"a": "a", "c": "c", "n": "1"}
+        for namer_cls in [NumberedNamer, VectorizedNumberedNamer]:
+            with self.subTest(namer=namer_cls.__name__):
+                self.assertEqual(namer_cls(components).name, "a_c_7")
+                self.assertEqual(namer_cls.format(components), "a_c_7")
+                self.assertEqual(namer_cls.format("a_c_1"), "a_c_7")
+                self.assertEqual(
+                    namer_cls.format_components_df(
+                        pd.DataFrame([components])
+                    ).tolist(),
+                    ["a_c_7"],
+                )
+
+    def test_skip_forced_components(self):
+        components_df = pd.DataFrame([{"a": "a", "c": "c", "n": "1"}])
+        for namer_cls in [NumberedNamer, VectorizedNumberedNamer]:
+            with self.subTest(namer=namer_cls.__name__):
+                self.assertEqual(
+                    namer_cls.format_components_df(
+                        components_df, skip_forced_components=True
+                    ).tolist(),
+                    ["a_c_1"],
+                )
+
+
+class TestPickle(unittest.TestCase):
+    def test_round_trip(self):
+        namers = [
+            DTIDNamer("doc/table/1"),
+            DTIDNamer({"document_id": "doc", "tabletype": "table", "tnum": 1}),
+            SlugNamer("active_22ghosts"),
+            SSFileNamer("report.pdf"),
+        ]
+        for namer in namers:
+            with self.subTest(namer=namer.components):
+                # a SSFileNamer only generates its prefix here
+                name = namer.name
+                unpickled = pickle.loads(pickle.dumps(namer))
+                self.assertIs(type(unpickled), type(namer))
+                self.assertIs(
+                    type(unpickled._components), type(namer._components)
+                )
+                self.assertEqual(unpickled.components, namer.components)
+                self.assertEqual(unpickled.name, name)
+
+    def test_round_trip_with_missing_components(self):
+        namer = DTIDNamer("doc/table")
+        unpickled = pickle.loads(pickle.dumps(namer))
+        self.assertEqual(
+            unpickled.components, {"document_id": "doc", "tabletype": "table"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+import pandas as pd
+
+from other_namer_example import SSFileNamer, parse_ss_file_name
+
+
+class TestParseSSFileNamesSeries(unittest.TestCase):
+    def test_vectorized_parser_matches_scalar_parser(self):
+        names = [
+            "^abc|foo",
+            "^abc|",
+            "^a\nc|d|e",
+            "foo",
+            "abc^xyz|foo",
+            "foo ^xyz|bar",
+            "^ab|x",
+            "^abc",
+            "^",
+            "",
+        ]
+        parsed = SSFileNamer.parse_names_series(pd.Series(names))
+
+        for i, name in enumerate(names):
+            expected = parse_ss_file_name(name)
+            with self.subTest(name=name):
+                if expected["prefix"] is None:
+                    self.assertTrue(pd.isnull(parsed["prefix"].iloc[i]))
+                else:
+                    self.assertEqual(
+                        parsed["prefix"].iloc[i], expected["prefix"]
+                    )
+                self.assertEqual(parsed["fname"].iloc[i], expected["fname"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from schema import And, Optional, Schema, SchemaError, Use
+
+from utils import (
+    get_components_validator,
+    get_name_formatter,
+    get_vectorized_name_formatter,
+)
+
+
+def _to_int_str(value):
+    return str(int(value))
+
+
+SCHEMA = Schema({"name": str, "count": int, "tnum": Use(_to_int_str)})
+
+
+class TestGetComponentsValidator(unittest.TestCase):
+    def assert_same_result(self, schematic, components):
+        validate = get_components_validator(schematic)
+        try:
+            expected = schematic.validate(components)
+        except SchemaError as e:
+            with self.assertRaises(SchemaError) as raised:
+                validate(components)
+            self.assertIs(type(raised.exception), type(e))
+            self.assertEqual(str(raised.exception), str(e))
+        else:
+            self.assertEqual(validate(components), expected)
+
+    def test_is_compiled_for_flat_schemas(self):
+        self.assertIsNot(get_components_validator(SCHEMA), SCHEMA.validate)
+
+    def test_matches_schema_validate(self):
+        cases = {
+            "valid": {"name": "a", "count": 1, "tnum": 7.0},
+            "bool for int": {"name": "a", "count": True, "tnum": 1},
+            "wrong type": {"name": 1, "count": 1, "tnum": 1},
+            "missing key": {"name": "a", "count": 1},
+            "missing keys": {"name": "a"},
+            "extra key": {"name": "a", "count": 1, "tnum": 1, "x": 1},
+            "extra keys": {"name": "a", "count": 1, "tnum": 1, "x": 1, "y": 2},
+            "missing and extra keys": {"name": "a", "x": 1},
+            "invalid value and missing key": {"name": 1},
+            "Use failure": {"name": "a", "count": 1, "tnum": "x"},
+            "not a dict": ["a", 1, 1],
+        }
+        for case, components in cases.items():
+            with self.subTest(case=case):
+                self.assert_same_result(SCHEMA, components)
+
+    def test_falls_back_to_schema_validate(self):
+        schematics = [
+            Schema({"name": str}, error="invalid name"),
+            Schema({"name": Use(int, error="invalid name")}),
+            Schema({"name": str}, name="Name"),
+            Schema({"name": str}, ignore_extra_keys=True),
+            Schema({Optional("name"): str}),
+            Schema({"name": lambda value: value > 0}),
+        ]
+        for schematic in schematics:
+            with self.subTest(schema=schematic):
+                self.assertEqual(
+                    get_components_validator(schematic), schematic.validate
+                )
+                self.assert_same_result(schematic, {"name": "a"})
+                self.assert_same_result(schematic, {"name": 1})
+
+
+class TestGetVectorizedNameFormatter(unittest.TestCase):
+    def assert_same_names(self, schematic, components_df):
+        keys = list(components_df.columns)
+        format_name = get_name_formatter(keys, schematic)
+        format_names = get_vectorized_name_formatter(keys, schematic)
+        rows = components_df.to_dict("records")
+        try:
+            expected = [format_name(row) for row in rows]
+        except SchemaError:
+            with self.assertRaises(SchemaError):
+                format_names(components_df)
+        else:
+            self.assertEqual(format_names(components_df).tolist(), expected)
+
+    def test_matches_name_formatter(self):
+        schematics = {
+            "flat": Schema(
+                {"name": str, "tnum": Use(_to_int_str), "label": Use(str)}
+            ),
+            "not flat": Schema(
+                {
+                    "name": And(str, len),
+                    "tnum": Use(_to_int_str),
+                    "label": Use(str),
+                }
+            ),
+        }
+        components_dfs = {
+            "valid": pd.DataFrame(
+                {"name": ["a", "b"], "tnum": [1.0, 2.0], "label": [1, 2]}
+            ),
+            "missing label": pd.DataFrame(
+                {"name": ["a", "b"], "tnum": [1, 2], "label": ["x", None]}
+            ),
+            "empty": pd.DataFrame(
+                {"name": [], "tnum": [], "label": []}, dtype=object
+            ),
+            "missing name": pd.DataFrame(
+                {"name": ["a", np.nan], "tnum": [1, 2], "label": [1, 2]}
+            ),
+            "int name": pd.DataFrame(
+                {"name": ["a", 1], "tnum": [1, 2], "label": [1, 2]}
+            ),
+            "Use failure": pd.DataFrame(
+                {"name": ["a", "b"], "tnum": ["1", "x"], "label": [1, 2]}
+            ),
+        }
+        for schema_case, schematic in schematics.items():
+            for df_case, components_df in components_dfs.items():
+                with self.subTest(schema=schema_case, df=df_case):
+                    self.assert_same_names(schematic, components_df)
+
+
+if __name__ == "__main__":
+    unittest.main()
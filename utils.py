@@ -1,5 +1,25 @@
+import functools
+import math
+import os
 import random
 import string
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from schema import (
+    Schema,
+    SchemaError,
+    SchemaMissingKeyError,
+    SchemaWrongKeyError,
+    Use,
+)
+
+_ALPHABET = string.ascii_lowercase + string.ascii_uppercase + string.digits
+_ALPHABET_ARRAY = np.array(list(_ALPHABET))
+
+# below this number of values, starting processes costs more than it saves.
+_PARALLEL_MIN_VALUES = 10000
 
 
 def get_name_parser(component_keys, separator="_"):
@@ -7,46 +27,441 @@ def get_name_parser(component_keys, separator="_"):
     factory to get a method which extracts components from a name string.
     """
 
+    keys = tuple(component_keys)
+    maxsplit = len(keys) - 1
+
+    # the components dict is built by a function which is generated for this
+    # fixed set of keys, which avoids the zip and the generic dict build.
+    namespace = {}
+    exec(
+        "def make_components(parts):\n"
+        "    return {"
+        + ", ".join(f"{key!r}: parts[{i}]" for i, key in enumerate(keys))
+        + "}\n",
+        namespace,
+    )
+    make_components = namespace["make_components"]
+
     def parse_name(name):
-        return dict(
-            zip(
-                component_keys,
-                str(name).split(separator),
+        parts = str(name).split(separator, maxsplit)
+        if len(parts) == len(keys):
+            return make_components(parts)
+        # the name has too few components
+        return dict(zip(keys, parts))
+
+    return parse_name
+
+
+def get_vectorized_name_parser(component_keys, separator="_"):
+    """
+    factory to get a method which extracts components from a pd.Series of name
+    strings at once, returning a pd.DataFrame with a column per component.
+    """
+
+    def parse_names(names):
+        return (
+            names.astype(str)
+            .str.split(separator, n=len(component_keys) - 1, expand=True)
+            # names with too few components would otherwise drop columns
+            .reindex(columns=range(len(component_keys)))
+            .set_axis(component_keys, axis=1)
+        )
+
+    return parse_names
+
+
+def _get_type_validator(key, type_):
+    def validate_type(value):
+        # schema does not accept a bool where an int is expected.
+        if not isinstance(value, type_) or (
+            type_ is int and isinstance(value, bool)
+        ):
+            raise SchemaError(
+                f"Key '{key}' error:\n"
+                f"{value!r} should be instance of {type_.__name__!r}",
+                None,
             )
+        return value
+
+    return validate_type
+
+
+def _get_use_validator(key, use):
+    convert = use._callable
+    convert_name = getattr(convert, "__name__", str(convert))
+
+    def validate_use(value):
+        try:
+            return convert(value)
+        except Exception as e:
+            raise SchemaError(
+                f"Key '{key}' error:\n{convert_name}({value!r}) raised {e!r}",
+                None,
+            ) from e
+
+    return validate_use
+
+
+def _plural_s(keys):
+    return "s" if len(keys) > 1 else ""
+
+
+def _get_flat_schema(schematic):
+    """
+    returns the dict of the given schematic if it maps str keys to types or
+    Use(...)s, which the specialized validators support, or None otherwise.
+    """
+    schema_dict = schematic.schema
+    if (
+        not isinstance(schema_dict, dict)
+        or schematic._ignore_extra_keys
+        # custom errors and schema names change the error messages
+        or schematic._error is not None
+        or schematic._name is not None
+    ):
+        return None
+
+    for key, value in schema_dict.items():
+        if type(key) is not str or not (
+            isinstance(value, type)
+            or (type(value) is Use and value._error is None)
+        ):
+            return None
+    return schema_dict
+
+
+def _get_value_validator(key, value):
+    if isinstance(value, type):
+        return _get_type_validator(key, value)
+    return _get_use_validator(key, value)
+
+
+def get_components_validator(schematic):
+    """
+    factory to get a method which validates (and converts) a components dict
+    like schematic.validate does, specialized to the shape of the schematic.
+
+    only flat dict schemas with str keys and types or Use(...) as values are
+    supported; for anything else, schematic.validate is returned as is.
+    """
+    schema_dict = _get_flat_schema(schematic)
+    if schema_dict is None:
+        return schematic.validate
+
+    validators = {
+        key: _get_value_validator(key, value)
+        for key, value in schema_dict.items()
+    }
+    keys = validators.keys()
+
+    def validate(components):
+        if type(components) is not dict:
+            return schematic.validate(components)
+        if components.keys() == keys:
+            return {
+                key: validate_value(components[key])
+                for key, validate_value in validators.items()
+            }
+
+        # like schema, the given values are validated before the keys
+        for key, validate_value in validators.items():
+            if key in components:
+                validate_value(components[key])
+        if missing_keys := keys - components.keys():
+            raise SchemaMissingKeyError(
+                f"Missing key{_plural_s(missing_keys)}: "
+                f"{', '.join(sorted(map(repr, missing_keys)))}",
+                None,
+            )
+        wrong_keys = components.keys() - keys
+        raise SchemaWrongKeyError(
+            f"Wrong key{_plural_s(wrong_keys)} "
+            f"{', '.join(sorted(map(repr, wrong_keys)))} in {components!r}",
+            None,
         )
 
-    return parse_name
+    return validate
+
+
+def validate_str_column(key, column):
+    """
+    checks that every value in the given pd.Series is a str, and raises the
+    same schema.SchemaError as the validator of a components dict otherwise.
+    """
+    # infer_dtype checks the whole column in C, which covers the common case
+    # of a valid column of strings.
+    inferred_dtype = pd.api.types.infer_dtype(column, skipna=False)
+    if not column.hasnans and inferred_dtype in ("string", "empty"):
+        return
+    # tolist returns python scalars, so that the error shows e.g. 1 instead
+    # of np.int64(1).
+    validate_value = _get_type_validator(key, str)
+    for value in column.tolist():
+        validate_value(value)
 
 
 def get_name_formatter(component_keys, schematic, separator="_"):
     """
     factory to get a method which formats name components into a string.
     """
+    validate_components = get_components_validator(schematic)
+    # the components are joined by a function which is generated for this
+    # fixed set of keys and separator, which avoids a generic loop and join.
+    namespace = {}
+    exec(
+        "def join_components(d):\n"
+        "    return "
+        + f" + {separator!r} + ".join(
+            f"str(d[{key!r}])" for key in component_keys
+        )
+        + "\n",
+        namespace,
+    )
+    join_components = namespace["join_components"]
 
     def format_name(obj={}, forced_components={}, **kwargs):
         # we allow user to either pass the object in as the first argument, or
         # as kwargs, and we merge these; on top of that come the
-        # forced_components.
-        components_raw = {**obj, **kwargs, **forced_components}
+        # forced_components. validation already returns a new dict, so we
+        # only copy obj if there is something to merge into it.
+        if kwargs or forced_components:
+            components_raw = dict(obj)
+            components_raw.update(kwargs)
+            components_raw.update(forced_components)
+        else:
+            components_raw = obj
 
         # validate and convert the components
-        components = schematic.validate(components_raw)
+        components = validate_components(components_raw)
 
         # turn into a string
-        return separator.join(
-            [components[component] for component in component_keys]
-        )
+        return join_components(components)
 
     return format_name
 
 
-def get_random_alphanumeric_string(length):
+def _restrict_schema(schematic, keys):
     """
-    Generate a random alphanumeric string of the given length
+    returns a schema.Schema which only validates the given keys of the given
+    dict schematic.
+    """
+    return Schema(
+        {
+            key: value
+            for key, value in schematic.schema.items()
+            # keys like Optional("prefix") wrap the actual key
+            if getattr(key, "schema", key) in keys
+        },
+        ignore_extra_keys=schematic._ignore_extra_keys,
+    )
+
+
+def _validate_column(schematic, key, column):
+    """
+    validates (and converts) a pd.Series of values for the given key, against
+    the part of the schematic for that key. equal values are only validated
+    once.
+    """
+    key_schematic = _restrict_schema(schematic, [key])
+    validated = {}
+    values = []
+    for value in column.tolist():
+        # the type is part of the key, because e.g. 3, 3.0 and True hash the
+        # same but may be converted differently.
+        value_key = (type(value), value)
+        if value_key not in validated:
+            validated[value_key] = key_schematic.validate({key: value})[key]
+        values.append(validated[value_key])
+    return pd.Series(values, index=column.index, dtype=object)
+
+
+def _get_column_validator(key, value):
+    """
+    factory to get a method which validates (and converts) a pd.Series of
+    values for the given key and value of a flat schema, checking the whole
+    column at once where possible.
     """
-    return "".join(
-        random.choice(
-            string.ascii_lowercase + string.ascii_uppercase + string.digits
+    if value is str:
+
+        def validate_str(column):
+            validate_str_column(key, column)
+            return column
+
+        return validate_str
+
+    if type(value) is Use and value._callable is str:
+        # astype(str) keeps missing values as they are, while str() doesn't
+        return lambda column: (
+            column.map(str) if column.hasnans else column.astype(str)
         )
-        for _ in range(length)
+
+    validate_value = _get_value_validator(key, value)
+    return lambda column: pd.Series(
+        list(map(validate_value, column.tolist())),
+        index=column.index,
+        dtype=object,
     )
+
+
+def get_vectorized_name_formatter(component_keys, schematic, separator="_"):
+    """
+    factory to get a method which formats a pd.DataFrame of name components
+    (one column per component) into a pd.Series of name strings at once.
+    """
+    # the columns are checked as a whole where the schematic allows it, and
+    # value by value otherwise.
+    schema_dict = _get_flat_schema(schematic) or {}
+    validate_columns = {
+        key: (
+            _get_column_validator(key, schema_dict[key])
+            if key in schema_dict
+            else functools.partial(_validate_column, schematic, key)
+        )
+        for key in component_keys
+    }
+
+    def format_names(
+        components_df, default_components={}, forced_components={}
+    ):
+        # the constant components (the ones which aren't taken from the df)
+        # are validated once up front, against the part of the schema for
+        # those keys; the df columns are validated column by column.
+        fixed_components = {**default_components, **forced_components}
+        constants = {
+            key: value
+            for key, value in fixed_components.items()
+            if key not in components_df or key in forced_components
+        }
+        constants = _restrict_schema(schematic, constants.keys()).validate(
+            constants
+        )
+        columns = [
+            (
+                validate_columns[key](components_df[key])
+                if key in components_df and key not in forced_components
+                else pd.Series(constants[key], index=components_df.index)
+            ).astype(str)
+            for key in component_keys
+        ]
+        return columns[0].str.cat(columns[1:], sep=separator).rename(None)
+
+    return format_names
+
+
+def _to_object_rows(df):
+    # materialize the df once as an object array, so that iterating over the
+    # rows doesn't create a pd.Series per row.
+    rows = np.empty(len(df), dtype=object)
+    rows[:] = list(map(tuple, df.to_numpy(dtype=object)))
+    return rows
+
+
+def check_n_jobs(n_jobs):
+    """
+    raises a ValueError if n_jobs is not a positive int or -1.
+    """
+    if (
+        isinstance(n_jobs, bool)
+        or not isinstance(n_jobs, int)
+        or (n_jobs < 1 and n_jobs != -1)
+    ):
+        raise ValueError(
+            f"n_jobs should be a positive int or -1, got {n_jobs!r}."
+        )
+
+
+def _apply_to_row(func, columns, row):
+    return func(dict(zip(columns, row)))
+
+
+def map_values(func, values, n_jobs=1):
+    """
+    apply func to every value in the given sequence, and return a list with
+    the results.
+
+    if n_jobs is not 1, the values are split in one chunk per process and
+    processed in n_jobs processes (or one per cpu, if n_jobs is -1), which
+    requires func to be picklable. for short sequences, the values are always
+    processed in the current process.
+    """
+    check_n_jobs(n_jobs)
+    if n_jobs == 1 or len(values) < _PARALLEL_MIN_VALUES:
+        return [func(value) for value in values]
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(
+            executor.map(
+                func, values, chunksize=math.ceil(len(values) / n_jobs)
+            )
+        )
+
+
+def apply_rows(df, func, n_jobs=1):
+    """
+    apply func to every row in df (passed as a dict of column to value), and
+    return a pd.Series with the results, with the same index as df.
+
+    see map_values for n_jobs.
+    """
+    # the row dicts are built one at a time, as func is applied to them.
+    results = np.empty(len(df), dtype=object)
+    results[:] = map_values(
+        functools.partial(_apply_to_row, func, list(df.columns)),
+        df.to_numpy(dtype=object),
+        n_jobs=n_jobs,
+    )
+    return pd.Series(results, index=df.index)
+
+
+def apply_rows_unique(df, func, n_jobs=1):
+    """
+    apply func to every unique row in df (passed as a dict of column to
+    value), and return a pd.Series with the results, with the same index as df.
+
+    see map_values for n_jobs.
+    """
+    codes, unique_rows = pd.factorize(_to_object_rows(df))
+
+    results = np.empty(len(unique_rows), dtype=object)
+    results[:] = map_values(
+        functools.partial(_apply_to_row, func, list(df.columns)),
+        unique_rows,
+        n_jobs=n_jobs,
+    )
+    return pd.Series(np.take(results, codes), index=df.index)
+
+
+def cache_name_parser(parse_name, maxsize=4096):
+    """
+    wrap a name parser in an lru cache, for workloads with many repeated names.
+
+    a copy of the cached components dict is returned, so that callers cannot
+    mutate the cache.
+    """
+    cached_parse_name = functools.lru_cache(maxsize=maxsize)(parse_name)
+
+    @functools.wraps(parse_name)
+    def parse_name_cached(name):
+        return dict(cached_parse_name(name))
+
+    parse_name_cached.cache_info = cached_parse_name.cache_info
+    parse_name_cached.cache_clear = cached_parse_name.cache_clear
+    return parse_name_cached
+
+
+def get_random_alphanumeric_string(length):
+    """
+    Generate a random alphanumeric string of the given length
+    """
+    return "".join(random.choices(_ALPHABET, k=length))
+
+
+def get_random_alphanumeric_strings(n, length):
+    """
+    Generate an array of n random alphanumeric strings of the given length,
+    drawing all characters at once.
+    """
+    indices = np.random.randint(0, len(_ALPHABET), size=(n, length))
+    return _ALPHABET_ARRAY[indices].view(f"U{length}").ravel()